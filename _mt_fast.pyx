@@ -0,0 +1,53 @@
+# cython: language_level=3
+"""
+_mt_fast.pyx
+------------
+Optional compiled version of the slime chunk check from formulas.py.
+All math is done on C unsigned 32-bit ints, so wrapping mod 2^32 is free and no Python objects are created.
+
+Build it with `pip install .` (or `python -m pip install -e .`), which needs Cython and a C compiler.
+formulas.py picks it up automatically and falls back to pure Python if it isn't built.
+"""
+
+# MT19937 parameters (same as formulas.py)
+cdef unsigned int W = 32, M = 397
+cdef unsigned int A = 0x9908B0DF
+cdef unsigned int U = 11
+cdef unsigned int S = 7, B = 0x9D2C5680
+cdef unsigned int T = 15, C = 0xEFC60000
+cdef unsigned int L = 18
+cdef unsigned int F = 1812433253
+cdef unsigned int LOWER_MASK = 0x7FFFFFFF
+cdef unsigned int UPPER_MASK = 0x80000000
+
+
+cdef inline unsigned int _first_mt_output(unsigned int mt0):
+    cdef unsigned int mt1 = F * (mt0 ^ (mt0 >> (W - 2))) + 1
+    cdef unsigned int prev = mt1
+    cdef unsigned int i, x, y
+    for i in range(2, M + 1):
+        prev = F * (prev ^ (prev >> (W - 2))) + i
+    # Single twist step for index 0 (prev is MT[397])
+    x = (mt0 & UPPER_MASK) | (mt1 & LOWER_MASK)
+    y = prev ^ (x >> 1) ^ ((<unsigned int>0 - (x & 1)) & A)
+    # Tempering
+    y ^= y >> U
+    y ^= (y << S) & B
+    y ^= (y << T) & C
+    y ^= y >> L
+    return y
+
+
+# The public functions take plain Python objects and mask them to 32 bits with Python's &, so they accept
+# and reject exactly the same inputs as the pure Python versions (any int works, floats raise TypeError).
+
+cpdef unsigned int first_mt_output(seed):
+    """Returns the first MersenneTwister(seed) output, see formulas.first_mt_output()."""
+    return _first_mt_output(seed & 0xffffffff)
+
+
+cpdef bint is_slime_chunk(chunk_x, chunk_z):
+    """Returns True if the chunk is a slime chunk in Bedrock Edition, see formulas.is_slime_chunk()."""
+    cdef unsigned int cx = chunk_x & 0xffffffff
+    cdef unsigned int cz = chunk_z & 0xffffffff
+    return _first_mt_output((cx * <unsigned int>0x1f1f1f1f) ^ cz) % 10 == 0